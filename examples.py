@@ -17,20 +17,20 @@ def demonstrate_bell_pair():
     
     sim = QuantumSimulator(2)
     sim.create_bell_pair()
-    sim.measure_all()
-    results = sim.run(shots=1000)
+    # Only the distribution is needed, so skip measurement and shot sampling
+    results = sim.run(exact=True)
     
     # Display results
     console.print("\n[bold green]Bell Pair Results:[/bold green]")
     
     # Create histogram
     hist = "\n"
-    for state, count in sorted(results.items()):
-        percentage = (count / 1000) * 100
-        bars = "█" * int(percentage / 2)
-        hist += f"|{state}⟩ {bars} {percentage:5.1f}% ({count})\n"
+    for state, probability in sorted(results.items()):
+        percentage = probability * 100
+        bars = "█" * round(percentage / 2)
+        hist += f"|{state}⟩ {bars} {percentage:5.1f}%\n"
     
-    console.print(Panel(hist, title="Measurement Distribution", border_style="blue"))
+    console.print(Panel(hist, title="Probability Distribution", border_style="blue"))
     
     # Display quantum circuit
     circuit = """
@@ -46,9 +46,9 @@ def demonstrate_bell_pair():
     stats_table.add_column("Metric", style="cyan")
     stats_table.add_column("Value", style="magenta")
     
-    stats_table.add_row("Total Measurements", str(sum(results.values())))
+    stats_table.add_row("Total Probability", f"{sum(results.values()):.3f}")
     stats_table.add_row("Unique States", str(len(results)))
-    stats_table.add_row("Fidelity", f"{(results.get('00', 0) + results.get('11', 0))/1000:.3f}")
+    stats_table.add_row("Fidelity", f"{results.get('00', 0) + results.get('11', 0):.3f}")
     
     console.print(stats_table)
     return results
@@ -129,7 +129,7 @@ def run_all_demos():
     summary.add_column("Quality", style="yellow")
     
     # Calculate quality metrics
-    bell_quality = (bell_results.get('00', 0) + bell_results.get('11', 0))/1000
+    bell_quality = bell_results.get('00', 0) + bell_results.get('11', 0)
     teleport_quality = max(teleport_results.values()) / 1000
     
     summary.add_row(
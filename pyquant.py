@@ -1,16 +1,102 @@
 from qiskit_aer import AerSimulator
-from qiskit import QuantumCircuit
+from qiskit import QuantumCircuit, transpile
 from qiskit.visualization import plot_histogram
 import numpy as np
+from functools import lru_cache
+
+# Shared AerSimulator instances per device ('GPU' or 'CPU'), so the backend
+# (and the GPU context/cuStateVec handle) is only initialized once per process
+_SIMULATORS = {}
+
+@lru_cache(maxsize=None)
+def _available_devices():
+    """
+    Devices supported by the installed qiskit-aer build, probed once
+    """
+    return tuple(AerSimulator().available_devices())
+
+def get_simulator(device='auto'):
+    """
+    Return the shared AerSimulator for the given device ('auto', 'GPU' or 'CPU').
+    'auto' uses the cuStateVec GPU backend when qiskit-aer-gpu is available
+    and falls back to the CPU statevector backend otherwise; it shares the
+    instance of the device it resolves to.
+    """
+    if device not in ('auto', 'GPU', 'CPU'):
+        raise ValueError(f"Unknown device '{device}', expected 'auto', 'GPU' or 'CPU'")
+    # AerSimulator accepts device='GPU' even on CPU-only builds,
+    # so check the available devices before committing to it
+    gpu_available = 'GPU' in _available_devices()
+    if device == 'auto':
+        device = 'GPU' if gpu_available else 'CPU'
+    elif device == 'GPU' and not gpu_available:
+        raise RuntimeError("GPU device is not available, install qiskit-aer-gpu")
+    if device not in _SIMULATORS:
+        _SIMULATORS[device] = _create_simulator(device)
+    return _SIMULATORS[device]
+
+def _create_simulator(device):
+    """
+    Construct an AerSimulator for the resolved device ('GPU' or 'CPU')
+
+    Single precision halves statevector memory traffic and is far more
+    precise than the 1/shots sampling resolution of the results; the
+    exact=True path of QuantumSimulator.run overrides it with double
+    """
+    if device == 'GPU':
+        return AerSimulator(
+            method='statevector',
+            device='GPU',
+            precision='single',
+            cuStateVec_enable=True
+        )
+    return AerSimulator(method='statevector', device='CPU', precision='single')
 
 class QuantumSimulator:
-    def __init__(self, num_qubits):
+    def __init__(self, num_qubits, device='auto'):
         """
         Initialize quantum simulator with specified number of qubits
+
+        The underlying AerSimulator is shared between instances with the
+        same device, see get_simulator()
         """
         self.num_qubits = num_qubits
         self.circuit = QuantumCircuit(num_qubits, num_qubits)  # quantum and classical registers
-        self.simulator = AerSimulator()
+        self.simulator = get_simulator(device)
+        self._compiled = None
+        self._compiled_source = None
+        self._compiled_size = 0
+    
+    def reset(self):
+        """
+        Start a new empty circuit on the same simulator
+
+        The AerSimulator keeps no state between run() calls, so it is reused
+        as is; only the circuit is replaced. For a circuit family that only
+        differs in gate angles, a compiled Parameter template bound with
+        parameter_binds avoids rebuilding the circuit at all
+        """
+        self.circuit = QuantumCircuit(self.num_qubits, self.num_qubits)
+        self._compiled = None
+        self._compiled_source = None
+        self._compiled_size = 0
+        return self
+
+    def compile(self):
+        """
+        Transpile the current circuit for the simulator once
+
+        run() and execute() reuse the transpiled circuit until instructions
+        are added, reset() is called or self.circuit is replaced. Editing
+        existing instructions in place after compile() is not detected;
+        call compile() again in that case. Build circuits with Qiskit
+        Parameter objects and bind them per run (parameter_binds) to
+        transpile a circuit family exactly once
+        """
+        self._compiled = transpile(self.circuit, self.simulator, optimization_level=0)
+        self._compiled_source = self.circuit
+        self._compiled_size = len(self.circuit.data)
+        return self
     
     def apply_hadamard(self, qubit):
         """
@@ -44,18 +130,84 @@ class QuantumSimulator:
         """
         Measure all qubits
         """
-        for i in range(self.num_qubits):
-            self.circuit.measure(i, i)
+        qubits = list(range(self.num_qubits))
+        self.circuit.measure(qubits, qubits)
         return self
     
-    def run(self, shots=1000):
+    def run(self, shots=1000, exact=False, **run_options):
         """
         Execute the quantum circuit and return results
-        """
-        job = self.simulator.run(self.circuit, shots=shots)
-        result = job.result()
+
+        With exact=True the outcome probabilities are computed directly from
+        the statevector instead of sampling shots, and a dict of bitstring
+        to probability is returned. Otherwise shot counts are returned.
+        Extra keyword arguments are passed to AerSimulator.run as run options
+        """
+        if exact:
+            return self._run_exact(**run_options)
+        result = self.execute(shots=shots, **run_options)
         counts = result.get_counts(self.circuit)
         return counts
+
+    def execute(self, shots=1000, **run_options):
+        """
+        Execute the quantum circuit and return the raw simulator Result
+
+        Uses the circuit transpiled by compile() when it is still current;
+        otherwise the simulator transpiles the circuit itself
+        """
+        job = self.simulator.run(self.current_circuit(), shots=shots, **run_options)
+        return job.result()
+
+    def current_circuit(self):
+        """
+        The circuit execute() would submit: the compile() result while it is
+        still current, otherwise the raw circuit
+
+        Useful for batching several simulators' circuits into one
+        simulator.run() call
+        """
+        if (self._compiled is not None and self.circuit is self._compiled_source
+                and self._compiled_size == len(self.circuit.data)):
+            return self._compiled
+        return self.circuit
+
+    def _run_exact(self, **run_options):
+        """
+        Compute measurement probabilities without the shot-sampling loop
+
+        Final measurements are replaced by a single save_probabilities
+        instruction on the measured qubits; a circuit without measurements
+        is treated as measuring every qubit into the classical bit of the
+        same index
+        """
+        measured = {}  # classical bit -> measured qubit
+        for instruction in self.circuit.data:
+            if instruction.operation.name == 'measure':
+                qubit = self.circuit.find_bit(instruction.qubits[0]).index
+                clbit = self.circuit.find_bit(instruction.clbits[0]).index
+                measured[clbit] = qubit
+        if not measured:
+            measured = {i: i for i in range(self.num_qubits)}
+        clbits = sorted(measured)
+
+        circuit = self.circuit.remove_final_measurements(inplace=False)
+        if any(instruction.operation.name == 'measure' for instruction in circuit.data):
+            raise ValueError("exact=True requires all measurements to be at the end of the circuit")
+        circuit.save_probabilities([measured[clbit] for clbit in clbits])
+
+        # A single shot, so double precision costs next to nothing here
+        run_options = {'precision': 'double', **run_options}
+        result = self.simulator.run(circuit, shots=1, **run_options).result()
+        probabilities = result.data(0)['probabilities']
+
+        # Outcome bit k belongs to clbits[k]; format keys like get_counts
+        width = self.circuit.num_clbits or self.num_qubits
+        distribution = {}
+        for index in np.flatnonzero(probabilities > 1e-12):
+            outcome = sum(((int(index) >> k) & 1) << clbit for k, clbit in enumerate(clbits))
+            distribution[format(outcome, f'0{width}b')] = float(probabilities[index])
+        return distribution
     
     def create_bell_pair(self):
         """
@@ -1,5 +1,8 @@
 from transformers import AutoTokenizer
 from pyquant import QuantumSimulator
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.quantum_info import Operator, Statevector
 import numpy as np
 from rich.console import Console
 from rich.table import Table
@@ -9,9 +12,24 @@ from typing import List, Dict, Tuple
 from rich.panel import Panel
 from dotenv import load_dotenv
 import os
+import time
+from functools import lru_cache
+from contextlib import nullcontext
 import huggingface_hub
 from datetime import datetime
 
+try:
+    import cupy
+except ImportError:
+    cupy = None
+
+try:
+    import numba
+    from numba import prange
+except ImportError:
+    numba = None
+    prange = range
+
 console = Console()
 
 # Load environment variables
@@ -23,14 +41,103 @@ def log_proses(message: str, error: bool = False):
     timestamp = datetime.now().strftime("%H:%M:%S")
     console.print(f"[{style}][{timestamp}] {message}[/{style}]")
 
+def _encode_batch(amplitude_angles, phase_angles, use_amplitude, use_phase,
+                  u_hcnot, cnot_perm, out_probs):
+    """
+    Kernel statevector ter-fusi per token untuk CPU (dikompilasi dengan Numba)
+    
+    Ry, lapisan H, Rz dan tangga CNOT dijalankan dalam satu loop per token
+    tanpa array sementara NumPy; qubit 0 adalah bit terendah indeks state.
+    Semua nilai diketik eksplisit complex64/float32 (lihat STATE_DTYPE)
+    agar tidak dipromosikan ke presisi ganda.
+    """
+    dim = out_probs.shape[1]
+    half = np.float32(0.5)
+    for t in prange(out_probs.shape[0]):
+        psi = np.zeros(dim, dtype=np.complex64)
+        tmp = np.empty(dim, dtype=np.complex64)
+        psi[0] = 1.0
+        
+        if use_amplitude:
+            c = np.cos(amplitude_angles[t] * half)
+            s = np.sin(amplitude_angles[t] * half)
+            for k in range(0, dim, 2):
+                x0 = psi[k]
+                x1 = psi[k + 1]
+                psi[k] = c * x0 - s * x1
+                psi[k + 1] = s * x0 + c * x1
+            for k in range(dim):
+                tmp[k] = psi[cnot_perm[k]]
+            psi[:] = tmp
+            
+        if use_phase:
+            rz0 = np.complex64(np.exp(-0.5j * phase_angles[t]))
+            rz1 = np.complex64(np.exp(0.5j * phase_angles[t]))
+            for i in range(dim):
+                acc = np.complex64(0)
+                for j in range(dim):
+                    acc += u_hcnot[i, j] * psi[j]
+                tmp[i] = acc * rz1 if i & 1 else acc * rz0
+            psi[:] = tmp
+                
+        for k in range(dim):
+            out_probs[t, k] = psi[k].real**2 + psi[k].imag**2
+
+if numba is not None:
+    _encode_batch = numba.njit(parallel=True, fastmath=True, cache=True)(_encode_batch)
+
+# Di bawah jumlah token ini biaya transfer PCIe lebih besar dari percepatan GPU
+GPU_MIN_TOKENS = 256
+
+# Presisi tunggal sudah jauh melebihi kebutuhan embedding token (tokenizer dan
+# model bekerja di BF16/FP16), sekaligus memangkas setengah trafik memori
+STATE_DTYPE = np.complex64
+
+# Progress bar hanya sepadan dengan biaya renderer Rich untuk batch sebesar ini
+PROGRESS_MIN_TOKENS = 32
+
+class _ArrayBackend:
+    """
+    Adapter minimal agar kernel statevector batch berjalan di NumPy, CuPy atau PyTorch
+    
+    Kernel hanya memakai einsum, abs, matmul, indexing dan broadcasting yang
+    tersedia dengan nama sama di ketiga library; yang berbeda hanya cara
+    memindahkan array dari dan ke host. Backend 'numba' memakai _encode_batch.
+    """
+    def __init__(self, name: str, xp, asarray, asnumpy):
+        self.name = name
+        self.xp = xp
+        self.asarray = asarray
+        self.asnumpy = asnumpy
+
+def _available_backends() -> Dict[str, _ArrayBackend]:
+    """
+    Mendeteksi backend array yang bisa dipakai di mesin ini
+    """
+    backends = {'numpy': _ArrayBackend('numpy', np, np.asarray, np.asarray)}
+    if numba is not None:
+        backends['numba'] = _ArrayBackend('numba', np, np.asarray, np.asarray)
+    if cupy is not None and cupy.cuda.is_available():
+        backends['cupy'] = _ArrayBackend('cupy', cupy, cupy.asarray, cupy.asnumpy)
+    if torch.cuda.is_available():
+        backends['torch'] = _ArrayBackend(
+            'torch',
+            torch,
+            lambda array: torch.as_tensor(array, device='cuda'),
+            lambda tensor: tensor.cpu().numpy()
+        )
+    return backends
+
 class QuantumTokenProcessor:
-    def __init__(self, model_name: str = "mistralai/Mixtral-8x7B-v0.1", n_qubits: int = 4):
+    def __init__(self, model_name: str = "mistralai/Mixtral-8x7B-v0.1", n_qubits: int = 4,
+                 backend: str = 'auto'):
         """
         Inisialisasi Quantum Token Processor dengan autentikasi HuggingFace
         
         Args:
             model_name: Nama model untuk tokenizer
             n_qubits: Jumlah qubit yang digunakan
+            backend: Backend kernel statevector ('auto', 'numpy', 'numba', 'cupy' atau 'torch')
         """
         self.hf_token = os.getenv("HUGGINGFACE_TOKEN")
         if not self.hf_token:
@@ -55,8 +162,14 @@ class QuantumTokenProcessor:
         self.n_qubits = n_qubits
         self.quantum_sim = QuantumSimulator(n_qubits)
         
+        # Cache tokenisasi per instance; lru_cache pada method akan menyimpan
+        # referensi ke setiap instance (dan tokenizer-nya) di level class
+        self._encode = lru_cache(maxsize=128)(self._encode_uncached)
+        
         # Inisialisasi skema encoding
         self.initialize_quantum_schemes()
+        self.initialize_statevector_kernel()
+        self.initialize_array_backend(backend)
         
     def initialize_quantum_schemes(self):
         """
@@ -68,97 +181,410 @@ class QuantumTokenProcessor:
             'hybrid': self._hybrid_encoding
         }
         
-    def _amplitude_encoding(self, token_id: int) -> None:
+        # Sirkuit setiap skema dibangun sekali dengan Parameter dan di-transpile
+        # sekali; sudut per token diikat saat run
+        self._amplitude_param = Parameter('amplitude_angle')
+        self._phase_param = Parameter('phase_angle')
+        self._scheme_simulators = {}
+        
+        # Tangga CNOT (i -> i+1) dipakai kedua encoder, dibangun sekali saja
+        self._cnot_ladder = QuantumCircuit(self.n_qubits, name='cnot_ladder')
+        for i in range(self.n_qubits - 1):
+            self._cnot_ladder.cx(i, i + 1)
+        
+    def initialize_statevector_kernel(self):
         """
-        Mengkodekan informasi token dalam amplitudo keadaan kuantum
+        Prekomputasi gate yang tidak bergantung pada token untuk kernel NumPy
+        
+        Matriksnya diturunkan dengan Operator dari sub-sirkuit yang sama dengan
+        encoder Qiskit, jadi urutan qubit otomatis mengikuti Qiskit
+        (little-endian): qubit 0 adalah bit terendah indeks statevector, yaitu
+        sumbu terakhir pada reshape(-1, 2)
         """
-        normalized_value = (token_id % 2**self.n_qubits) / (2**self.n_qubits)
-        angle = normalized_value * np.pi
+        # Tangga CNOT hanya menukar state basis: baris j matriksnya bernilai 1
+        # di kolom perm[j], sehingga penerapannya cukup psi_baru = psi[perm]
+        cnot_ladder = Operator(self._cnot_ladder).data
+        self._cnot_perm = np.argmax(np.abs(cnot_ladder), axis=1)
+        
+        # Lapisan H dan tangga CNOT tidak bergantung token, jadi difusi menjadi
+        # satu unitary. Rz pada qubit 0 komut dengan tangga CNOT (qubit 0 hanya
+        # menjadi kontrol), sehingga Rz cukup diterapkan setelah unitary ini
+        fused_circuit = QuantumCircuit(self.n_qubits)
+        fused_circuit.h(range(self.n_qubits))
+        fused_circuit.compose(self._cnot_ladder, inplace=True)
+        self._U_HCNOT = Operator(fused_circuit).data.astype(STATE_DTYPE)
+        
+        self._initial_state = Statevector.from_label('0' * self.n_qubits).data.astype(STATE_DTYPE)
+        self._device_constants = {}
+        
+    def initialize_array_backend(self, backend: str = 'auto'):
+        """
+        Memilih backend array untuk kernel statevector batch
         
-        self.quantum_sim.circuit.ry(angle, 0)
+        Dengan 'auto', batch kecil tetap di CPU (Numba bila terpasang, jika
+        tidak NumPy), sedangkan batch dengan minimal GPU_MIN_TOKENS token
+        memakai backend tercepat hasil benchmark singkat
+        """
+        available = _available_backends()
+        if backend == 'auto':
+            self._small_batch_backend = available.get('numba', available['numpy'])
+            self._large_batch_backend = self._fastest_backend(list(available.values()))
+        elif backend in available:
+            self._small_batch_backend = self._large_batch_backend = available[backend]
+        else:
+            raise ValueError(
+                f"Backend '{backend}' tidak tersedia, pilihan: {', '.join(available)}"
+            )
+        log_proses(f"Backend kernel statevector: {self._large_batch_backend.name}")
         
-        for i in range(self.n_qubits - 1):
-            self.quantum_sim.apply_cnot(i, i + 1)
+    def _fastest_backend(self, backends: List[_ArrayBackend]) -> _ArrayBackend:
+        """
+        Benchmark kernel pada batch GPU_MIN_TOKENS token dan kembalikan backend tercepat
+        """
+        if len(backends) == 1:
+            return backends[0]
             
-    def _phase_encoding(self, token_id: int) -> None:
+        probe = np.arange(GPU_MIN_TOKENS, dtype=np.int64)
+        timings = []
+        for backend in backends:
+            # Putaran pertama sekaligus pemanasan konteks CUDA dan konstanta device
+            self._run_kernel(probe, 'hybrid', backend)
+            start = time.perf_counter()
+            self._run_kernel(probe, 'hybrid', backend)
+            timings.append(time.perf_counter() - start)
+        return backends[int(np.argmin(timings))]
+        
+    def _kernel_constants(self, backend: _ArrayBackend) -> Tuple:
         """
-        Mengkodekan informasi token dalam fase kuantum
+        Unitary H+CNOT ter-fusi dan permutasi CNOT yang disimpan di device backend
+        """
+        if backend.name not in self._device_constants:
+            self._device_constants[backend.name] = (
+                backend.asarray(np.ascontiguousarray(self._U_HCNOT.T)),
+                backend.asarray(self._cnot_perm)
+            )
+        return self._device_constants[backend.name]
+        
+    def _amplitude_encoding(self, circuit: QuantumCircuit, amplitude_angle, phase_angle) -> QuantumCircuit:
+        """
+        Mengkodekan informasi token dalam amplitudo keadaan kuantum
+        
+        Sudut berupa float atau Parameter Qiskit (lihat _encoding_angles);
+        phase_angle tidak dipakai skema ini
         """
-        for i in range(self.n_qubits):
-            self.quantum_sim.circuit.h(i)
+        circuit.ry(amplitude_angle, 0)
+        circuit.compose(self._cnot_ladder, qubits=range(self.n_qubits), inplace=True)
+        return circuit
             
-        normalized_phase = (token_id % 2**self.n_qubits) / (2**self.n_qubits) * 2 * np.pi
-        self.quantum_sim.circuit.rz(normalized_phase, 0)
+    def _phase_encoding(self, circuit: QuantumCircuit, amplitude_angle, phase_angle) -> QuantumCircuit:
+        """
+        Mengkodekan informasi token dalam fase kuantum
         
-        for i in range(self.n_qubits - 1):
-            self.quantum_sim.apply_cnot(i, i + 1)
+        amplitude_angle tidak dipakai skema ini
+        """
+        circuit.h(range(self.n_qubits))
+        circuit.rz(phase_angle, 0)
+        circuit.compose(self._cnot_ladder, qubits=range(self.n_qubits), inplace=True)
+        return circuit
             
-    def _hybrid_encoding(self, token_id: int) -> None:
+    def _hybrid_encoding(self, circuit: QuantumCircuit, amplitude_angle, phase_angle) -> QuantumCircuit:
         """
         Menggunakan encoding amplitudo dan fase
         """
-        amplitude_part = token_id % 2**(self.n_qubits-1)
-        phase_part = token_id // 2**(self.n_qubits-1)
+        self._amplitude_encoding(circuit, amplitude_angle, phase_angle)
+        return self._phase_encoding(circuit, amplitude_angle, phase_angle)
+        
+    def _angles_for(self, tokens: np.ndarray) -> np.ndarray:
+        """
+        Sudut dasar (token mod 2**n) / 2**n * pi untuk seluruh array token
+        
+        Modulo pangkat dua dihitung dengan bitmask AND dalam satu operasi
+        vektor, bukan modulo Python per token
+        """
+        n_states = 2**self.n_qubits
+        return (tokens & (n_states - 1)).astype(np.float32) * np.float32(np.pi / n_states)
+        
+    def _encoding_angles(self, tokens: np.ndarray, scheme: str) -> Tuple:
+        """
+        Menghitung sudut Ry dan fase Rz per token untuk skema encoding
+        
+        Args:
+            tokens: Array ID token int64 dengan shape (T,)
+            scheme: Skema encoding yang digunakan
+        
+        Returns:
+            Tuple (sudut amplitudo, sudut fase); None bila tahap tersebut
+            tidak dipakai skema
+        """
+        if scheme == 'amplitude':
+            return self._angles_for(tokens), None
+        if scheme == 'phase':
+            return None, 2 * self._angles_for(tokens)
+            
+        # Hybrid, juga fallback untuk skema tak dikenal seperti encoding_schemes:
+        # bit rendah untuk amplitudo, sisanya (geser kanan) untuk fase
+        amplitude_part = tokens & ((1 << (self.n_qubits - 1)) - 1)
+        phase_part = tokens >> (self.n_qubits - 1)
+        return self._angles_for(amplitude_part), 2 * self._angles_for(phase_part)
+        
+    def _amplitude_state(self, psi, angles: np.ndarray, backend: _ArrayBackend):
+        """
+        Versi statevector dari _amplitude_encoding: Ry pada qubit 0, lalu tangga CNOT
         
-        self._amplitude_encoding(amplitude_part)
-        self._phase_encoding(phase_part)
+        Args:
+            psi: Batch statevector di device backend dengan shape (T, 2**n_qubits)
+            angles: Sudut Ry (NumPy) dengan shape (T,)
+            backend: Backend array tempat psi berada
+        """
+        c, s = np.cos(angles / 2), np.sin(angles / 2)
+        ry = np.stack([np.stack([c, -s], axis=-1), np.stack([s, c], axis=-1)], axis=1)
+        _, cnot_perm = self._kernel_constants(backend)
+        
+        psi = backend.xp.einsum(
+            'tij,tkj->tki',
+            backend.asarray(ry.astype(STATE_DTYPE)),
+            psi.reshape(len(psi), 2**(self.n_qubits-1), 2)
+        )
+        return psi.reshape(len(psi), 2**self.n_qubits)[:, cnot_perm]
+        
+    def _phase_state(self, psi, phases: np.ndarray, backend: _ArrayBackend):
+        """
+        Versi statevector dari _phase_encoding: unitary H+CNOT ter-fusi, lalu Rz pada qubit 0
+        """
+        rz = backend.asarray(np.exp(np.outer(phases, np.array([-0.5j, 0.5j], dtype=STATE_DTYPE))))
+        u_hcnot_t, _ = self._kernel_constants(backend)
+        
+        psi = psi @ u_hcnot_t
+        psi = psi.reshape(len(psi), 2**(self.n_qubits-1), 2) * rz[:, np.newaxis, :]
+        return psi.reshape(len(psi), 2**self.n_qubits)
+        
+    def _run_kernel(self, tokens: np.ndarray, scheme: str, backend: _ArrayBackend) -> np.ndarray:
+        """
+        Menjalankan kernel statevector batch di backend tertentu
         
-    def process_token(self, token_id: int, scheme: str = 'hybrid') -> Dict[str, float]:
+        Statevector tetap di device selama kernel; hanya tensor probabilitas
+        akhir yang disalin kembali ke host
+        """
+        amplitude_angles, phase_angles = self._encoding_angles(tokens, scheme)
+        
+        if backend.name == 'numba':
+            probs = np.empty((len(tokens), 2**self.n_qubits), dtype=np.float32)
+            unused = np.zeros(len(tokens), dtype=np.float32)
+            _encode_batch(
+                unused if amplitude_angles is None else amplitude_angles,
+                unused if phase_angles is None else phase_angles,
+                amplitude_angles is not None,
+                phase_angles is not None,
+                self._U_HCNOT,
+                self._cnot_perm.astype(np.int32),
+                probs
+            )
+            return probs
+            
+        psi = backend.asarray(np.tile(self._initial_state, (len(tokens), 1)))
+        if amplitude_angles is not None:
+            psi = self._amplitude_state(psi, amplitude_angles, backend)
+        if phase_angles is not None:
+            psi = self._phase_state(psi, phase_angles, backend)
+        return backend.asnumpy(backend.xp.abs(psi)**2)
+        
+    def _simulate_tokens(self, tokens: np.ndarray, scheme: str = 'hybrid') -> np.ndarray:
+        """
+        Menghitung distribusi probabilitas eksak seluruh token sekaligus
+        
+        Args:
+            tokens: Array ID token dengan shape (T,)
+            scheme: Skema encoding yang digunakan
+            
+        Returns:
+            Array probabilitas float32 dengan shape (T, 2**n_qubits)
+        """
+        tokens = np.asarray(tokens, dtype=np.int64)
+        if len(tokens) >= GPU_MIN_TOKENS:
+            backend = self._large_batch_backend
+        else:
+            backend = self._small_batch_backend
+        return self._run_kernel(tokens, scheme, backend)
+        
+    def _scheme_simulator(self, scheme: str) -> QuantumSimulator:
+        """
+        Simulator berisi sirkuit terukur berparameter untuk satu skema
+        
+        Struktur gate sama untuk semua token, hanya sudut Ry/Rz yang berbeda,
+        sehingga sirkuit cukup di-transpile sekali. Skema 'phase' memakai
+        sirkuit master hybrid dengan sudut amplitudo 0: Ry(0) dan tangga CNOT
+        membiarkan |0...0⟩ tetap, jadi distribusinya identik. Skema
+        'amplitude' tidak punya lapisan H, sehingga butuh sirkuit sendiri
+        """
+        template = 'amplitude' if scheme == 'amplitude' else 'hybrid'
+        if template not in self._scheme_simulators:
+            sim = QuantumSimulator(self.n_qubits)
+            self.encoding_schemes[template](sim.circuit, self._amplitude_param, self._phase_param)
+            sim.measure_all()
+            self._scheme_simulators[template] = sim.compile()
+        return self._scheme_simulators[template]
+        
+    def _parameter_binds(self, tokens: np.ndarray, scheme: str) -> Dict:
+        """
+        Nilai Parameter per token untuk opsi run parameter_binds milik Aer
+        """
+        amplitude_angles, phase_angles = self._encoding_angles(tokens, scheme)
+        if scheme == 'phase':
+            # Sirkuit master hybrid, tahap amplitudo dimatikan dengan sudut 0
+            amplitude_angles = np.zeros_like(phase_angles)
+        binds = {}
+        if amplitude_angles is not None:
+            binds[self._amplitude_param] = amplitude_angles.tolist()
+        if phase_angles is not None:
+            binds[self._phase_param] = phase_angles.tolist()
+        return binds
+        
+    def process_token(self, token_id: int, scheme: str = 'hybrid', exact: bool = True) -> np.ndarray:
         """
         Memproses satu token melalui sirkuit kuantum
         
         Args:
             token_id: ID token yang akan diproses
             scheme: Skema encoding yang digunakan ('amplitude', 'phase', atau 'hybrid')
+            exact: Hitung probabilitas eksak dari statevector; False untuk
+                sampling 1000 shot di simulator
+            
+        Returns:
+            Array float32 dengan panjang 2**n_qubits; indeks i adalah state
+            basis |i⟩ (bitstring format(i, '0nb') seperti key counts Qiskit)
+        """
+        if exact:
+            # Sirkuit tanpa noise: |<x|psi>|^2 dihitung langsung dengan NumPy
+            return self._simulate_tokens([token_id], scheme)[0]
+        
+        # Sirkuit skema sudah di-transpile; cukup ikat sudut token ini
+        sim = self._scheme_simulator(scheme)
+        # Sirkuit kecil: overhead thread dan truncation lebih besar dari simulasinya
+        results = sim.run(
+            shots=1000,
+            parameter_binds=[self._parameter_binds(np.asarray([token_id], dtype=np.int64), scheme)],
+            max_parallel_threads=1,
+            enable_truncation=False
+        )
+        
+        prob_dist = np.zeros(2**self.n_qubits, dtype=np.float32)
+        for state, count in results.items():
+            prob_dist[int(state, 2)] = count / 1000
+        return prob_dist
+    
+    def _progress(self, total: int):
         """
-        self.quantum_sim = QuantumSimulator(self.n_qubits)
+        Context Progress Rich, atau nullcontext bila batch kecil / bukan terminal
+        """
+        if total < PROGRESS_MIN_TOKENS or not console.is_terminal:
+            return nullcontext()
+        return Progress(console=console)
         
-        encoding_func = self.encoding_schemes.get(scheme, self._hybrid_encoding)
-        encoding_func(token_id)
+    def _encode_uncached(self, text: str) -> Tuple[int, ...]:
+        """
+        Tokenisasi teks; dipakai lewat self._encode, cache LRU per instance
+        (lihat __init__) agar teks yang sama tidak di-encode ulang
         
-        self.quantum_sim.measure_all()
-        results = self.quantum_sim.run(shots=1000)
+        Returns:
+            Tuple ID token (hashable, aman untuk di-cache)
+        """
+        return tuple(self.tokenizer.encode(text))
         
-        prob_dist = {k: v/1000 for k, v in results.items()}
-        return prob_dist
-    
-    def process_text(self, text: str, scheme: str = 'hybrid') -> List[Dict[str, float]]:
+    def process_text(self, text: str, scheme: str = 'hybrid', exact: bool = True) -> np.ndarray:
         """
         Memproses seluruh teks melalui sirkuit kuantum
         
         Args:
             text: Teks input yang akan diproses
             scheme: Skema encoding yang digunakan
+            exact: Hitung probabilitas eksak; False untuk sampling 1000 shot
+        """
+        return self.process_tokens(self._encode(text), scheme, exact)
+        
+    def process_tokens(self, tokens: Tuple[int, ...], scheme: str = 'hybrid',
+                       exact: bool = True) -> np.ndarray:
         """
-        tokens = self.tokenizer.encode(text)
+        Memproses deretan ID token yang sudah di-tokenisasi
         
-        quantum_embeddings = []
-        with Progress() as progress:
-            task = progress.add_task("[cyan]Memproses token...", total=len(tokens))
+        Args:
+            tokens: ID token hasil tokenizer
+            scheme: Skema encoding yang digunakan
+            exact: Hitung probabilitas eksak; False untuk sampling 1000 shot
             
-            for token in tokens:
-                quantum_embeddings.append(self.process_token(token, scheme))
-                progress.advance(task)
+        Returns:
+            Array float32 dengan shape (T, 2**n_qubits), satu distribusi per token
+        """
+        return self.process_schemes(tokens, [scheme], exact)[scheme]
+        
+    def process_schemes(self, tokens: Tuple[int, ...], schemes: List[str],
+                        exact: bool = True) -> Dict[str, np.ndarray]:
+        """
+        Memproses deretan ID token yang sama dengan beberapa skema sekaligus
+        
+        Args:
+            tokens: ID token hasil tokenizer
+            schemes: Daftar skema encoding
+            exact: Hitung probabilitas eksak; False untuk sampling 1000 shot
+            
+        Returns:
+            Dict skema -> array float32 dengan shape (T, 2**n_qubits)
+        """
+        # Satu array int64 untuk seluruh token; sudut dihitung sekaligus dari sini
+        tokens = np.asarray(tokens, dtype=np.int64)
+        
+        if exact:
+            # Satu kernel ter-vektorisasi per skema, tanpa loop Python per token
+            return {scheme: self._simulate_tokens(tokens, scheme) for scheme in schemes}
+        
+        shots = 1000
+        n_states = 2**self.n_qubits
+        if len(tokens) == 0:
+            return {scheme: np.zeros((0, n_states), dtype=np.float32) for scheme in schemes}
+            
+        total = len(tokens) * len(schemes)
+        with self._progress(total) as progress:
+            if progress is not None:
+                task = progress.add_task("[cyan]Memproses token...", total=total)
                 
-        return quantum_embeddings
+            # Satu job Aer untuk semua skema dan token: sirkuit ter-transpile
+            # yang di-cache, sudut per token diikat lewat parameter_binds
+            result = self.quantum_sim.simulator.run(
+                [self._scheme_simulator(scheme).current_circuit() for scheme in schemes],
+                shots=shots,
+                parameter_binds=[self._parameter_binds(tokens, scheme) for scheme in schemes],
+                max_parallel_experiments=0
+            ).result()
+            
+            if progress is not None:
+                progress.update(task, completed=total)
+        
+        # Counts per eksperimen (paling banyak 2**n entri hex) langsung
+        # diisikan ke array padat. Urutan eksperimen: skema demi skema,
+        # token demi token
+        counts = np.zeros((total, n_states), dtype=np.float32)
+        for i in range(total):
+            for state, count in result.data(i)['counts'].items():
+                counts[i, int(state, 16)] = count
+        probabilities = counts.reshape(len(schemes), len(tokens), n_states) / np.float32(shots)
+        return dict(zip(schemes, probabilities))
     
-    def visualize_processing(self, text: str) -> None:
+    def visualize_processing(self, text: str, exact: bool = True) -> None:
         """
         Visualisasi pemrosesan token kuantum
         
         Args:
             text: Teks input untuk divisualisasi
+            exact: Probabilitas eksak; False untuk sampling 1000 shot
         """
         schemes = ['amplitude', 'phase', 'hybrid']
-        results = {}
         
         console.print("\n[bold green]Memproses teks dengan berbagai skema kuantum...[/bold green]")
         
-        tokens = self.tokenizer.encode(text)
-        token_strings = self.tokenizer.convert_ids_to_tokens(tokens)
+        # Tokenisasi sekali, dipakai ulang untuk ketiga skema
+        tokens = self._encode(text)
+        token_strings = self.tokenizer.convert_ids_to_tokens(list(tokens))
         
-        for scheme in schemes:
-            results[scheme] = self.process_text(text, scheme)
+        results = self.process_schemes(tokens, schemes, exact)
             
         # Tabel perbandingan
         table = Table(title="Hasil Pemrosesan Token Kuantum")
@@ -171,12 +597,14 @@ class QuantumTokenProcessor:
             }[scheme]
             table.add_column(scheme_name, style="magenta")
             
+        # State paling mungkin per token untuk setiap skema
+        max_states = {scheme: np.argmax(results[scheme], axis=1) for scheme in schemes}
+            
         for i, token in enumerate(token_strings):
             row = [token]
             for scheme in schemes:
-                prob_dist = results[scheme][i]
-                max_state = max(prob_dist.items(), key=lambda x: x[1])
-                row.append(f"|{max_state[0]}⟩ ({max_state[1]:.2f})")
+                state = max_states[scheme][i]
+                row.append(f"|{state:0{self.n_qubits}b}⟩ ({results[scheme][i, state]:.2f})")
             table.add_row(*row)
             
         console.print(table)
@@ -195,6 +623,16 @@ class QuantumTokenProcessor:
         # Hitung nilai untuk format string
         start_cnot = self.n_qubits + 1
         end_cnot = (self.n_qubits * 2)
+        if exact:
+            probability_info = """- Probabilitas per token: eksak dari statevector
+           • Setiap state basis memperoleh probabilitas |⟨x|ψ⟩|²
+           • Distribusi menunjukkan properti kuantum token
+           • Tanpa noise sampling dari shot"""
+        else:
+            probability_info = """- Probabilitas per token: sampling 1000 shot
+           • Frekuensi tiap state basis dibagi jumlah shot
+           • Distribusi menunjukkan properti kuantum token
+           • Mengandung noise sampling ~1/√shot"""
         
         # Informasi encoding
         encoding_info = f"""
@@ -224,14 +662,11 @@ class QuantumTokenProcessor:
            • Layer 1-{self.n_qubits}: Gate Hadamard (H)
            • Layer {start_cnot}-{end_cnot}: Gate CNOT
            • Layer {self.n_qubits * 2 + 1}: Gate rotasi final
-        - Pengukuran per token: 1000
-           • Setiap pengukuran menghasilkan state basis
-           • Distribusi menunjukkan properti kuantum token
-           • 1000 shot memberikan statistik yang reliable
+        {probability_info}
         
         [bold]Catatan Penting:[/bold]
         - Semakin dalam sirkuit, semakin kaya representasi
-        - Jumlah pengukuran memengaruhi akurasi distribusi
+        - Mode sampling (exact=False) memakai 1000 shot per token
         - Entanglement antar qubit menciptakan korelasi kuantum
         """
         
@@ -241,7 +676,7 @@ class QuantumTokenProcessor:
         stats_info = f"""
         [bold]Statistik Pemrosesan:[/bold]
         - Token yang diproses: {len(token_strings)}
-        - Total pengukuran: {len(token_strings) * 1000}
+        - Total state basis: {len(token_strings) * 2**self.n_qubits}
         - Kedalaman sirkuit: {self.n_qubits * 2 + 1} layer
         - Status: [green]Selesai[/green]
         """
@@ -0,0 +1,61 @@
+import pytest
+from qiskit import QuantumCircuit
+from pyquant import QuantumSimulator
+
+def test_compile_not_reused_for_replaced_circuit():
+    """
+    A compile() result must not be reused for a replacement circuit of the same length
+    """
+    sim = QuantumSimulator(1)
+    sim.circuit.x(0)
+    sim.measure_all()
+    sim.compile()
+
+    replacement = QuantumCircuit(1, 1)
+    replacement.id(0)
+    replacement.measure(0, 0)
+    sim.circuit = replacement
+
+    assert sim.current_circuit() is sim.circuit
+    assert sim.run() == {'0': 1000}
+
+def test_exact_maps_classical_bits():
+    """
+    exact=True keys follow the classical bit each qubit was measured into
+    """
+    sim = QuantumSimulator(3)
+    sim.circuit.x(0)
+    sim.measure_qubit(0, 2)
+    assert sim.run(exact=True) == {'100': 1.0}
+
+def test_exact_keys_match_counts():
+    """
+    exact=True uses the same bitstring keys as get_counts
+    """
+    sim = QuantumSimulator(3)
+    sim.quantum_teleportation([1, 0.5])
+    probabilities = sim.run(exact=True)
+    assert set(probabilities) == set(sim.run(shots=1000))
+    assert abs(sum(probabilities.values()) - 1.0) < 1e-12
+
+def test_exact_bell_pair():
+    """
+    A Bell pair gives 1/2 for |00> and |11>, summing to 1 in double precision
+    """
+    sim = QuantumSimulator(2)
+    sim.create_bell_pair()
+    probabilities = sim.run(exact=True)
+    assert set(probabilities) == {'00', '11'}
+    assert abs(probabilities['00'] - 0.5) < 1e-12
+    assert abs(sum(probabilities.values()) - 1.0) < 1e-12
+
+def test_exact_rejects_mid_circuit_measurement():
+    """
+    exact=True cannot replace a measurement that is followed by more gates
+    """
+    sim = QuantumSimulator(1)
+    sim.measure_qubit(0, 0)
+    sim.apply_hadamard(0)
+    sim.measure_qubit(0, 0)
+    with pytest.raises(ValueError):
+        sim.run(exact=True)
@@ -0,0 +1,47 @@
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import Statevector
+from quantum_token_processor import QuantumTokenProcessor, _available_backends
+
+N_QUBITS = 4
+# Termasuk ID token >= 2**n untuk menguji bitmask pada _angles_for
+TOKENS = [0, 1, 7, 8, 15, 16, 523, 9999, 31999]
+
+def make_processor(backend):
+    """
+    Processor tanpa tokenizer HuggingFace; kernel statevector tidak memerlukannya
+    """
+    processor = QuantumTokenProcessor.__new__(QuantumTokenProcessor)
+    processor.n_qubits = N_QUBITS
+    processor.initialize_quantum_schemes()
+    processor.initialize_statevector_kernel()
+    processor.initialize_array_backend(backend)
+    return processor
+
+def reference_probabilities(processor, token, scheme):
+    """
+    Probabilitas dari encoder Qiskit dengan sudut float64 menurut rumus awal
+    """
+    n_states = 2**N_QUBITS
+    amplitude_angle = (token % n_states) / n_states * np.pi
+    phase_angle = (token % n_states) / n_states * 2 * np.pi
+    if scheme == 'hybrid':
+        half = 2**(N_QUBITS - 1)
+        amplitude_angle = (token % half % n_states) / n_states * np.pi
+        phase_angle = (token // half % n_states) / n_states * 2 * np.pi
+    circuit = QuantumCircuit(N_QUBITS)
+    processor.encoding_schemes[scheme](circuit, amplitude_angle, phase_angle)
+    return Statevector(circuit).probabilities()
+
+def test_kernels_match_qiskit_encoders():
+    """
+    Setiap backend kernel (complex64) harus sama dengan Statevector Qiskit
+    """
+    for backend in _available_backends():
+        processor = make_processor(backend)
+        for scheme in ['amplitude', 'phase', 'hybrid']:
+            probabilities = processor._simulate_tokens(np.array(TOKENS), scheme)
+            expected = np.array([reference_probabilities(processor, token, scheme) for token in TOKENS])
+            assert probabilities.shape == (len(TOKENS), 2**N_QUBITS)
+            assert probabilities.dtype == np.float32
+            np.testing.assert_allclose(probabilities, expected, atol=1e-5, err_msg=f"{backend}/{scheme}")